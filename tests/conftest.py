@@ -2,87 +2,131 @@
 Test configuration and fixtures for the Mergington High School API tests.
 """
 
+import json
+from pathlib import Path
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    """Import the application module lazily.
+
+    Deferring the import keeps ``--collect-only`` and filtered runs from
+    paying for FastAPI app construction.
+    """
+    from src import app as m
+    return m
+
+
+@pytest.fixture(scope="session")
+def client(app_module):
+    """Create a test client for the FastAPI application, shared across the session.
+
+    Entering the client as a context manager runs the app's startup and
+    shutdown events exactly once for the whole test run.
+    """
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+# Pristine activity data, loaded once; participants are frozen so the template
+# can be shared with tests that never mutate it
+_ORIGINAL_ACTIVITIES = {
+    name: {**details, "participants": frozenset(details["participants"])}
+    for name, details in json.loads(
+        (Path(__file__).parent / "fixtures" / "activities.json").read_text()
+    ).items()
+}
+
+
+def _restore_activities(activities, mutable=True):
+    """Restore activities from the template.
+
+    Participants are copied into fresh sets only when ``mutable`` is true;
+    otherwise the template's frozensets are shared as-is. This doubles as a
+    tripwire: a read-only test that signs a student up fails with an
+    ``AttributeError`` raised from the app's ``frozenset.add`` call.
+    """
+    activities.clear()
+    activities.update({
+        name: {
+            **details,
+            "participants": set(details["participants"]) if mutable else details["participants"],
+        }
+        for name, details in _ORIGINAL_ACTIVITIES.items()
+    })
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+def reset_activities(app_module, activities_state):
+    """Reset activities to a writable original state for a single test.
+
+    Afterwards the frozen module-level state is restored, so later tests in
+    the module that rely on ``activities_state`` see pristine data.
+    """
+    _restore_activities(app_module.activities)
+    yield
+    _restore_activities(app_module.activities, mutable=False)
+
+
+@pytest.fixture(scope="module")
+def activities_state(app_module):
+    """Reset activities to original state once per test module.
+
+    Participants are left frozen, so tests that only read activity data can
+    rely on this alone; tests that mutate data should use ``isolate_activity``
+    or ``reset_activities``.
+    """
+    _restore_activities(app_module.activities, mutable=False)
+    yield
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities to original state before each test."""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly games",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["liam@mergington.edu", "ava@mergington.edu"]
-        },
-        "Art Workshop": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Mondays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ella@mergington.edu", "noah@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act, direct, and produce school plays and performances",
-            "schedule": "Tuesdays, 5:00 PM - 6:30 PM",
-            "max_participants": 20,
-            "participants": ["jack@mergington.edu", "grace@mergington.edu"]
-        },
-        "Mathletes": {
-            "description": "Compete in math competitions and solve challenging problems",
-            "schedule": "Fridays, 4:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["ben@mergington.edu", "chloe@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 14,
-            "participants": ["ethan@mergington.edu", "zoe@mergington.edu"]
-        }
+def readonly_client(client, activities_state):
+    """Test client for tests that never mutate activity data.
+
+    Skips the per-test reset and relies on the module-level reset instead.
+    """
+    yield client
+
+
+@pytest.fixture(scope="class")
+def sample_responses(client, activities_state):
+    """Successful and error responses captured once per test class.
+
+    Lets tests that only inspect response envelopes (headers, error shape)
+    share a single round trip per endpoint.
+    """
+    return {
+        "ok": client.get("/activities"),
+        "err": client.post("/activities/NonExistent/signup?email=test@example.com"),
     }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    
+
+
+@pytest.fixture
+def isolate_activity(request, app_module, activities_state):
+    """Make only the activities a test mutates writable, restoring them afterwards.
+
+    The activities are named with ``@pytest.mark.activity("Chess Club", ...)``.
+    """
+    activities = app_module.activities
+    marker = request.node.get_closest_marker("activity")
+    if marker is None or not marker.args:
+        pytest.fail("isolate_activity requires @pytest.mark.activity(...) naming the mutated activities")
+    unknown = [name for name in marker.args if name not in activities]
+    if unknown:
+        pytest.fail(f"@pytest.mark.activity names unknown activities: {', '.join(unknown)}")
+    snapshot = {name: activities[name]["participants"] for name in marker.args}
+    for name, participants in snapshot.items():
+        activities[name]["participants"] = set(participants)
+
     yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+
+    for name, participants in snapshot.items():
+        activities[name]["participants"] = participants
 
 
 @pytest.fixture
@@ -0,0 +1,17 @@
+"""
+Shared constants for the Mergington High School API tests.
+"""
+
+from urllib.parse import quote
+
+# Plain ints avoid repeated attribute lookups on fastapi.status in assertions
+OK = 200
+TEMPORARY_REDIRECT = 307
+BAD_REQUEST = 400
+NOT_FOUND = 404
+METHOD_NOT_ALLOWED = 405
+UNPROCESSABLE_ENTITY = 422
+
+SIGNUP_URL = "/activities/{}/signup?email={}"
+UNREGISTER_URL = "/activities/{}/unregister?email={}"
+ENCODED_CHESS_CLUB = quote("Chess Club", safe="")
@@ -3,7 +3,17 @@ Tests for the basic API endpoints and functionality.
 """
 
 import pytest
-from fastapi import status
+
+from tests.constants import (
+    BAD_REQUEST,
+    ENCODED_CHESS_CLUB,
+    NOT_FOUND,
+    OK,
+    SIGNUP_URL,
+    TEMPORARY_REDIRECT,
+    UNPROCESSABLE_ENTITY,
+    UNREGISTER_URL,
+)
 
 
 class TestBasicEndpoints:
@@ -12,13 +22,13 @@ class TestBasicEndpoints:
     def test_root_endpoint_redirects_to_static(self, client):
         """Test that root endpoint redirects to static index.html."""
         response = client.get("/", follow_redirects=False)
-        assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+        assert response.status_code == TEMPORARY_REDIRECT
         assert "/static/index.html" in response.headers["location"]
 
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
-        """Test that GET /activities returns all available activities."""
-        response = client.get("/activities")
-        assert response.status_code == status.HTTP_200_OK
+    def test_activities_shape(self, readonly_client):
+        """Test that GET /activities returns all activities with the correct structure."""
+        response = readonly_client.get("/activities")
+        assert response.status_code == OK
         
         data = response.json()
         assert isinstance(data, dict)
@@ -28,11 +38,6 @@ class TestBasicEndpoints:
         expected_activities = ["Chess Club", "Programming Class", "Gym Class"]
         for activity in expected_activities:
             assert activity in data
-
-    def test_activity_structure(self, client, reset_activities):
-        """Test that each activity has the correct structure."""
-        response = client.get("/activities")
-        data = response.json()
         
         for activity_name, activity_data in data.items():
             assert "description" in activity_data
@@ -55,118 +60,105 @@ class TestBasicEndpoints:
 class TestSignupEndpoint:
     """Test signup functionality."""
 
-    def test_successful_signup(self, client, reset_activities):
-        """Test successful signup for an activity."""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == status.HTTP_200_OK
+    @pytest.mark.parametrize("activity, emails", [
+        pytest.param("Chess Club", ["newstudent@mergington.edu"],
+                     marks=pytest.mark.activity("Chess Club")),
+        pytest.param("Programming Class", ["persistent@mergington.edu"],
+                     marks=pytest.mark.activity("Programming Class")),
+        pytest.param("Science Club",
+                     ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"],
+                     marks=pytest.mark.activity("Science Club")),
+    ])
+    def test_signup(self, client, isolate_activity, activity, emails):
+        """Test that students can sign up and appear in the activities list."""
+        for email in emails:
+            response = client.post(SIGNUP_URL.format(activity, email))
+            assert response.status_code == OK
+            
+            data = response.json()
+            assert "message" in data
+            assert email in data["message"]
+            assert activity in data["message"]
         
-        data = response.json()
-        assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
+        # Verify all students are registered
+        activities_response = client.get("/activities")
+        activities_data = activities_response.json()
+        
+        for email in emails:
+            assert email in activities_data[activity]["participants"]
 
-    def test_signup_for_nonexistent_activity(self, client, reset_activities):
+    def test_signup_for_nonexistent_activity(self, readonly_client):
         """Test signup for an activity that doesn't exist."""
-        response = client.post(
+        response = readonly_client.post(
             "/activities/Nonexistent Club/signup?email=student@mergington.edu"
         )
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.status_code == NOT_FOUND
         
         data = response.json()
         assert data["detail"] == "Activity not found"
 
-    def test_duplicate_signup_prevention(self, client, reset_activities):
+    @pytest.mark.activity("Chess Club")
+    def test_duplicate_signup_prevention(self, client, isolate_activity):
         """Test that students cannot sign up twice for the same activity."""
         email = "duplicate@mergington.edu"
         activity = "Chess Club"
         
         # First signup should succeed
-        response1 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response1.status_code == status.HTTP_200_OK
+        response1 = client.post(SIGNUP_URL.format(activity, email))
+        assert response1.status_code == OK
         
         # Second signup should fail
-        response2 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response2.status_code == status.HTTP_400_BAD_REQUEST
+        response2 = client.post(SIGNUP_URL.format(activity, email))
+        assert response2.status_code == BAD_REQUEST
         
         data = response2.json()
         assert data["detail"] == "Student already signed up"
 
-    def test_signup_persists_in_activities_list(self, client, reset_activities):
-        """Test that signup persists and appears in activities list."""
-        email = "persistent@mergington.edu"
-        activity = "Programming Class"
-        
-        # Sign up student
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response.status_code == status.HTTP_200_OK
-        
-        # Check that student appears in activities list
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
-        assert email in activities_data[activity]["participants"]
-
-    def test_multiple_students_can_signup(self, client, reset_activities):
-        """Test that multiple different students can sign up for the same activity."""
-        activity = "Science Club"
-        emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
-        
-        for email in emails:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == status.HTTP_200_OK
-        
-        # Verify all students are registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
-        for email in emails:
-            assert email in activities_data[activity]["participants"]
-
 
 class TestUnregisterEndpoint:
     """Test unregister functionality."""
 
-    def test_successful_unregister(self, client, reset_activities):
+    @pytest.mark.activity("Drama Club")
+    def test_successful_unregister(self, client, isolate_activity):
         """Test successful unregistration from an activity."""
         # First, sign up a student
         email = "temp@mergington.edu"
         activity = "Drama Club"
         
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response.status_code == status.HTTP_200_OK
+        signup_response = client.post(SIGNUP_URL.format(activity, email))
+        assert signup_response.status_code == OK
         
         # Then unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert unregister_response.status_code == status.HTTP_200_OK
+        unregister_response = client.delete(UNREGISTER_URL.format(activity, email))
+        assert unregister_response.status_code == OK
         
         data = unregister_response.json()
         assert "message" in data
         assert email in data["message"]
         assert activity in data["message"]
 
-    def test_unregister_from_nonexistent_activity(self, client, reset_activities):
+    def test_unregister_from_nonexistent_activity(self, readonly_client):
         """Test unregister from an activity that doesn't exist."""
-        response = client.delete(
+        response = readonly_client.delete(
             "/activities/Nonexistent Club/unregister?email=student@mergington.edu"
         )
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.status_code == NOT_FOUND
         
         data = response.json()
         assert data["detail"] == "Activity not found"
 
-    def test_unregister_when_not_registered(self, client, reset_activities):
+    def test_unregister_when_not_registered(self, readonly_client):
         """Test unregister when student is not registered for the activity."""
-        response = client.delete(
+        response = readonly_client.delete(
             "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
         )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == BAD_REQUEST
         
         data = response.json()
         assert data["detail"] == "Student is not registered for this activity"
 
-    def test_unregister_removes_from_participants_list(self, client, reset_activities):
+    @pytest.mark.activity("Chess Club")
+    def test_unregister_removes_from_participants_list(self, client, isolate_activity):
         """Test that unregister removes student from participants list."""
         # Use existing participant
         email = "michael@mergington.edu"  # Already in Chess Club
@@ -178,30 +170,31 @@ class TestUnregisterEndpoint:
         assert email in activities_data[activity]["participants"]
         
         # Unregister student
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert unregister_response.status_code == status.HTTP_200_OK
+        unregister_response = client.delete(UNREGISTER_URL.format(activity, email))
+        assert unregister_response.status_code == OK
         
         # Verify student is no longer in participants list
         activities_response = client.get("/activities")
         activities_data = activities_response.json()
         assert email not in activities_data[activity]["participants"]
 
-    def test_signup_after_unregister(self, client, reset_activities):
+    @pytest.mark.activity("Art Workshop")
+    def test_signup_after_unregister(self, client, isolate_activity):
         """Test that a student can sign up again after unregistering."""
         email = "rejoiner@mergington.edu"
         activity = "Art Workshop"
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response.status_code == status.HTTP_200_OK
+        signup_response = client.post(SIGNUP_URL.format(activity, email))
+        assert signup_response.status_code == OK
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert unregister_response.status_code == status.HTTP_200_OK
+        unregister_response = client.delete(UNREGISTER_URL.format(activity, email))
+        assert unregister_response.status_code == OK
         
         # Sign up again
-        signup_response2 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response2.status_code == status.HTTP_200_OK
+        signup_response2 = client.post(SIGNUP_URL.format(activity, email))
+        assert signup_response2.status_code == OK
         
         # Verify student is registered
         activities_response = client.get("/activities")
@@ -212,27 +205,30 @@ class TestUnregisterEndpoint:
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_special_characters_in_activity_name(self, client, reset_activities):
+    @pytest.mark.activity("Chess Club")
+    def test_special_characters_in_activity_name(self, client, isolate_activity):
         """Test handling of special characters in activity names."""
         # Add a test activity with spaces (URL encoding test)
-        response = client.post("/activities/Chess%20Club/signup?email=test@mergington.edu")
-        assert response.status_code == status.HTTP_200_OK
+        response = client.post(SIGNUP_URL.format(ENCODED_CHESS_CLUB, "test@mergington.edu"))
+        assert response.status_code == OK
 
-    def test_special_characters_in_email(self, client, reset_activities):
+    @pytest.mark.activity("Programming Class")
+    def test_special_characters_in_email(self, client, isolate_activity):
         """Test handling of special characters in email addresses."""
         email = "test+tag@mergington.edu"
         activity = "Programming Class"
         
-        response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response.status_code == status.HTTP_200_OK
+        response = client.post(SIGNUP_URL.format(activity, email))
+        assert response.status_code == OK
 
-    def test_empty_email_parameter(self, client, reset_activities):
+    @pytest.mark.activity("Chess Club")
+    def test_empty_email_parameter(self, client, isolate_activity):
         """Test handling of empty email parameter."""
         response = client.post("/activities/Chess Club/signup?email=")
         # Should still work as the backend doesn't validate email format
-        assert response.status_code in [status.HTTP_200_OK, status.HTTP_422_UNPROCESSABLE_ENTITY]
+        assert response.status_code in [OK, UNPROCESSABLE_ENTITY]
 
-    def test_missing_email_parameter(self, client, reset_activities):
+    def test_missing_email_parameter(self, readonly_client):
         """Test handling of missing email parameter."""
-        response = client.post("/activities/Chess Club/signup")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
\ No newline at end of file
+        response = readonly_client.post("/activities/Chess Club/signup")
+        assert response.status_code == UNPROCESSABLE_ENTITY
\ No newline at end of file
@@ -2,14 +2,26 @@
 Integration tests for the complete application workflow.
 """
 
+import asyncio
+
+import httpx
 import pytest
-from fastapi import status
+
+from tests.constants import (
+    ENCODED_CHESS_CLUB,
+    METHOD_NOT_ALLOWED,
+    NOT_FOUND,
+    OK,
+    SIGNUP_URL,
+    UNREGISTER_URL,
+)
 
 
 class TestCompleteWorkflow:
     """Test complete user workflows and integration scenarios."""
 
-    def test_complete_signup_and_unregister_workflow(self, client, reset_activities):
+    @pytest.mark.activity("Basketball Club")
+    def test_complete_signup_and_unregister_workflow(self, client, isolate_activity):
         """Test a complete workflow of signing up and then unregistering."""
         email = "workflow@mergington.edu"
         activity = "Basketball Club"
@@ -20,37 +32,32 @@ class TestCompleteWorkflow:
         initial_count = len(initial_data[activity]["participants"])
         
         # 2. Sign up for activity
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response.status_code == status.HTTP_200_OK
+        signup_response = client.post(SIGNUP_URL.format(activity, email))
+        assert signup_response.status_code == OK
         
-        # 3. Verify signup in activities list
-        after_signup_response = client.get("/activities")
-        after_signup_data = after_signup_response.json()
-        assert email in after_signup_data[activity]["participants"]
-        assert len(after_signup_data[activity]["participants"]) == initial_count + 1
+        # 3. Unregister from activity (only succeeds if the signup was recorded)
+        unregister_response = client.delete(UNREGISTER_URL.format(activity, email))
+        assert unregister_response.status_code == OK
         
-        # 4. Unregister from activity
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert unregister_response.status_code == status.HTTP_200_OK
-        
-        # 5. Verify unregistration in activities list
+        # 4. Verify unregistration in activities list
         after_unregister_response = client.get("/activities")
         after_unregister_data = after_unregister_response.json()
         assert email not in after_unregister_data[activity]["participants"]
         assert len(after_unregister_data[activity]["participants"]) == initial_count
 
-    def test_multiple_activities_signup(self, client, reset_activities):
+    @pytest.mark.activity("Soccer Team", "Basketball Club")
+    def test_multiple_activities_signup(self, client, isolate_activity):
         """Test a student signing up for multiple different activities."""
         email = "multisport@mergington.edu"
         activities = ["Soccer Team", "Basketball Club", "Swimming Club"]
         
         # Sign up for multiple activities
         for activity in activities:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            if response.status_code == status.HTTP_404_NOT_FOUND:
+            response = client.post(SIGNUP_URL.format(activity, email))
+            if response.status_code == NOT_FOUND:
                 # Skip if activity doesn't exist
                 continue
-            assert response.status_code == status.HTTP_200_OK
+            assert response.status_code == OK
         
         # Verify student is in all activities
         activities_response = client.get("/activities")
@@ -82,32 +89,35 @@ class TestCompleteWorkflow:
             # Fill remaining spots
             for i in range(available_spots):
                 email = f"student{i}@mergington.edu"
-                response = client.post(f"/activities/{test_activity}/signup?email={email}")
-                assert response.status_code == status.HTTP_200_OK
+                response = client.post(SIGNUP_URL.format(test_activity, email))
+                assert response.status_code == OK
             
             # Verify activity is now at capacity
             final_response = client.get("/activities")
             final_data = final_response.json()
             assert len(final_data[test_activity]["participants"]) == final_data[test_activity]["max_participants"]
 
-    def test_concurrent_signups_same_activity(self, client, reset_activities):
-        """Test multiple students signing up for the same activity."""
+    @pytest.mark.asyncio
+    @pytest.mark.activity("Mathletes")
+    async def test_concurrent_signups_same_activity(self, app_module, isolate_activity):
+        """Test multiple students signing up for the same activity concurrently."""
         activity = "Mathletes"
         emails = [f"concurrent{i}@mergington.edu" for i in range(3)]
         
-        # Sign up multiple students
-        responses = []
-        for email in emails:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            responses.append(response)
-        
-        # All should succeed
-        for response in responses:
-            assert response.status_code == status.HTTP_200_OK
-        
-        # Verify all are registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            # Sign up multiple students at once
+            responses = await asyncio.gather(
+                *(ac.post(SIGNUP_URL.format(activity, email)) for email in emails)
+            )
+            
+            # All should succeed
+            for response in responses:
+                assert response.status_code == OK
+            
+            # Verify all are registered
+            activities_response = await ac.get("/activities")
+            activities_data = activities_response.json()
         
         for email in emails:
             assert email in activities_data[activity]["participants"]
@@ -116,23 +126,28 @@ class TestCompleteWorkflow:
 class TestDataConsistency:
     """Test data consistency and state management."""
 
-    def test_activities_data_persistence_across_requests(self, client, reset_activities):
+    @pytest.mark.activity("Drama Club")
+    def test_activities_data_persistence_across_requests(self, client, isolate_activity):
         """Test that activity data persists across multiple requests."""
         email = "persistent@mergington.edu"
         activity = "Drama Club"
         
         # Make a signup
-        client.post(f"/activities/{activity}/signup?email={email}")
+        client.post(SIGNUP_URL.format(activity, email))
         
-        # Make multiple GET requests and ensure data is consistent
-        for _ in range(5):
-            response = client.get("/activities")
-            data = response.json()
-            assert email in data[activity]["participants"]
+        # Parse the first response once to check the signup was recorded
+        get = client.get
+        first_response = get("/activities")
+        assert email in first_response.json()[activity]["participants"]
+        
+        # Repeated GET requests should return byte-identical data
+        for _ in range(4):
+            response = get("/activities")
+            assert response.content == first_response.content
 
-    def test_participant_count_accuracy(self, client, reset_activities):
+    def test_participant_count_accuracy(self, readonly_client):
         """Test that participant counts are accurate."""
-        activities_response = client.get("/activities")
+        activities_response = readonly_client.get("/activities")
         activities_data = activities_response.json()
         
         for activity_name, activity_data in activities_data.items():
@@ -150,29 +165,28 @@ class TestDataConsistency:
 class TestErrorHandling:
     """Test comprehensive error handling scenarios."""
 
-    def test_malformed_requests(self, client, reset_activities):
+    def test_malformed_requests(self, readonly_client):
         """Test handling of malformed requests."""
         # Test with invalid HTTP methods
-        response = client.patch("/activities")
-        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        response = readonly_client.patch("/activities")
+        assert response.status_code == METHOD_NOT_ALLOWED
         
-        response = client.put("/activities/Chess Club/signup")
-        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        response = readonly_client.put("/activities/Chess Club/signup")
+        assert response.status_code == METHOD_NOT_ALLOWED
 
-    def test_url_encoding_edge_cases(self, client, reset_activities):
+    @pytest.mark.activity("Chess Club")
+    def test_url_encoding_edge_cases(self, client, isolate_activity):
         """Test URL encoding edge cases."""
         # Test activity name with spaces and special characters
-        encoded_activity = "Chess%20Club"
-        response = client.post(f"/activities/{encoded_activity}/signup?email=test@example.com")
-        assert response.status_code == status.HTTP_200_OK
+        response = client.post(SIGNUP_URL.format(ENCODED_CHESS_CLUB, "test@example.com"))
+        assert response.status_code == OK
 
-    def test_response_format_consistency(self, client, reset_activities):
+    def test_response_format_consistency(self, sample_responses):
         """Test that all responses follow consistent format."""
         # Test successful responses
-        response = client.get("/activities")
-        assert response.headers["content-type"] == "application/json"
+        assert sample_responses["ok"].headers["content-type"] == "application/json"
         
         # Test error responses
-        response = client.post("/activities/NonExistent/signup?email=test@example.com")
+        response = sample_responses["err"]
         assert response.headers["content-type"] == "application/json"
         assert "detail" in response.json()
\ No newline at end of file